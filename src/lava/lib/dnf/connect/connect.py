@@ -4,6 +4,7 @@
 
 import typing as ty
 import numpy as np
+import scipy.sparse
 
 from lava.magma.core.process.process import AbstractProcess
 from lava.proc.dense.models import Dense
@@ -13,6 +14,7 @@ from lava.lib.dnf.operations.operations import AbstractOperation, Weights
 from lava.lib.dnf.connect.exceptions import MisconfiguredConnectError
 from lava.lib.dnf.connect.reshape_bool.process import ReshapeBool
 from lava.lib.dnf.connect.reshape_int.process import ReshapeInt
+from lava.lib.dnf.utils.convenience import shapes_equal
 
 
 def connect(
@@ -27,7 +29,7 @@ def connect(
     InPort of <dst_ip>.
 
     The connectivity is generated from a list of operation objects <ops>.
-    Each operation generates a dense connectivity matrix based
+    Each operation generates a (dense or sparse) connectivity matrix based
     on its parameters. These matrices are multiplied into a single
     connectivity matrix, which is then used to generate a Connections Process
     between source and destination.
@@ -100,7 +102,7 @@ def _configure_ops(
 
     # Check that the output shape of the last operation matches the shape of
     # the InPort of the destination Process
-    if prev_output_shape != dst_shape:
+    if not shapes_equal(prev_output_shape, dst_shape):
         raise MisconfiguredConnectError(
             "the output shape of the last operation does not match the shape "
             "of the destination InPort; some operations may be misconfigured")
@@ -131,7 +133,7 @@ def _validate_ops(
     """
     # If no operations were specified...
     if ops is None:
-        if src_shape != dst_shape:
+        if not shapes_equal(src_shape, dst_shape):
             raise MisconfiguredConnectError(
                 f"shape of source Port {src_shape} != {dst_shape} "
                 "shape of destination Port; when connecting differently "
@@ -160,7 +162,9 @@ def _validate_ops(
     return ops
 
 
-def _compute_weights(ops: ty.List[AbstractOperation]) -> np.ndarray:
+def _compute_weights(
+    ops: ty.List[AbstractOperation]
+) -> ty.Union[np.ndarray, scipy.sparse.spmatrix]:
     """
     Compute the overall connectivity matrix to be used for the Connections
     Process from the individual connectivity matrices that each operation
@@ -173,7 +177,8 @@ def _compute_weights(ops: ty.List[AbstractOperation]) -> np.ndarray:
 
     Returns
     -------
-    weights : np.ndarray
+    weights : np.ndarray or scipy.sparse.spmatrix
+        stays sparse as long as all operations produce sparse matrices
 
     """
     weights = None
@@ -188,16 +193,19 @@ def _compute_weights(ops: ty.List[AbstractOperation]) -> np.ndarray:
         if weights is None:
             weights = op_weights
         # Otherwise, multiply weights with the connectivity matrix from the last
-        # operations in the list to create the overall weights matrix
+        # operations in the list to create the overall weights matrix;
+        # the matmul operator supports both dense and sparse matrices
         else:
-            weights = np.matmul(op_weights, weights)
+            weights = op_weights @ weights
 
     return weights
 
 
-def _make_connections(src_op: OutPort,
-                      dst_ip: InPort,
-                      weights: np.ndarray) -> AbstractProcess:
+def _make_connections(
+    src_op: OutPort,
+    dst_ip: InPort,
+    weights: ty.Union[np.ndarray, scipy.sparse.spmatrix]
+) -> AbstractProcess:
     """
     Creates a Connections Process with the given weights and connects its
     ports such that:
@@ -210,7 +218,7 @@ def _make_connections(src_op: OutPort,
         OutPort of the source Process
     dst_ip : InPort
         InPort of the destination Process
-    weights : numpy.ndarray
+    weights : numpy.ndarray or scipy.sparse.spmatrix
         connectivity weight matrix used for the Connections Process
 
     Returns
@@ -218,6 +226,9 @@ def _make_connections(src_op: OutPort,
     Connections Process : AbstractProcess
 
     """
+    # The Dense Process requires a dense weight matrix
+    if scipy.sparse.issparse(weights):
+        weights = weights.toarray()
 
     # Create the connections process
     connections = Dense(shape=weights.shape,
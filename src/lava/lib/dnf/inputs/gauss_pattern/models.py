@@ -3,6 +3,7 @@
 # See: https://spdx.org/licenses/
 
 import numpy as np
+import typing as ty
 
 from lava.magma.core.sync.protocols.loihi_protocol import LoihiProtocol
 from lava.magma.core.model.py.ports import PyOutPort
@@ -12,7 +13,7 @@ from lava.magma.core.decorator import implements, requires
 from lava.magma.core.model.py.model import PyLoihiProcessModel
 
 from lava.lib.dnf.inputs.gauss_pattern.process import GaussPattern
-from lava.lib.dnf.utils.math import gauss
+from lava.lib.dnf.utils.math import gauss_grid, evaluate_gauss
 
 
 # TODO: (GK) Change protocol to AsyncProtocol when supported
@@ -39,15 +40,22 @@ class GaussPatternProcessModel(PyLoihiProcessModel):
 
     a_out: PyOutPort = LavaPyType(PyOutPort.VEC_DENSE, float)
 
+    # Sampling points of the pattern; they only depend on the shape and
+    # are computed once, when the first pattern is computed
+    _grid: ty.Optional[ty.Sequence[np.ndarray]] = None
+
     def run_spk(self) -> None:
         # When changed flag is set to True...
         if self.changed[0]:
-            # ...compute new pattern based on updated parameters
-            self.pattern = gauss(shape=tuple(self._shape),
-                                 domain=None,
-                                 amplitude=self._amplitude[0],
-                                 mean=self._mean,
-                                 stddev=self._stddev)
+            if self._grid is None:
+                self._grid = gauss_grid(shape=tuple(self._shape))
+            # ...compute new pattern based on updated parameters, reusing
+            # the memory of the previous pattern
+            evaluate_gauss(self._grid,
+                           amplitude=self._amplitude[0],
+                           mean=self._mean,
+                           stddev=self._stddev,
+                           out=self.pattern)
             # Reset the 'changed' flag
             self.changed[0] = False
             # Send new pattern through the PyOutPort
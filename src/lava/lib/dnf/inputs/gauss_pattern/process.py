@@ -11,6 +11,11 @@ from lava.magma.core.process.ports.ports import OutPort
 
 from lava.lib.dnf.utils.validation import validate_shape
 
+# Value of the changed flag Var after a parameter was set; shared by all
+# setters to avoid allocating a new array on every update
+_CHANGED_TRUE = np.array([True], dtype=bool)
+_CHANGED_TRUE.setflags(write=False)
+
 
 class GaussPattern(AbstractProcess):
     """
@@ -40,13 +45,14 @@ class GaussPattern(AbstractProcess):
         super().__init__(**kwargs)
 
         shape = validate_shape(kwargs.pop("shape"))
+        # Dimensionality of the pattern; stored to validate parameters in
+        # the setters without reading back the shape Var
+        self._ndim = len(shape)
         amplitude = kwargs.pop("amplitude")
-        mean = self._validate_param(np.array(shape),
+        mean = self._validate_param(self._ndim,
                                     "mean",
                                     kwargs.pop("mean"))
-        stddev = self._validate_param(np.array(shape),
-                                      "stddev",
-                                      kwargs.pop("stddev"))
+        stddev = self._validate_stddev(kwargs.pop("stddev"))
 
         self._shape = Var(shape=(len(shape),), init=np.array(shape))
         self._amplitude = Var(shape=(1,), init=np.array([amplitude]))
@@ -60,19 +66,19 @@ class GaussPattern(AbstractProcess):
         self.a_out = OutPort(shape=shape)
 
     def _validate_param(self,
-                        shape: np.ndarray,
+                        ndim: int,
                         param_name: str,
                         param: ty.Union[float, ty.List[float]]) -> np.ndarray:
         """Validates that parameter param with name param_name is either
         a float value or a list of floats of the same length as the
-        dimensionality of the given shape.
+        dimensionality of the pattern.
 
         Returns param as ndarray.
 
         Parameters
         ----------
-        shape : numpy.ndarray
-            shape of the pattern
+        ndim : int
+            dimensionality of the pattern
         param_name : str
             name of the parameter (either mean or stddev)
         param : list(float) or float
@@ -83,35 +89,49 @@ class GaussPattern(AbstractProcess):
         param : numpy.ndarray
 
         """
-        if not isinstance(param, list):
-            param = float(param)
-            param = [param]
+        # Broadcast scalar param values to an array of length equal to the
+        # dimensionality
+        if np.isscalar(param):
+            return np.full(ndim, float(param))
 
-        # If param is of length 1, no validation against shape
-        if len(param) == 1:
-            param_val = param[0]
-            # Broadcast param value to a list of length equal to shape
-            # dimensionality
-            param = [param_val for _ in range(shape.shape[0])]
-        # Else, if param is of length > 1
-        elif len(param) > 1:
-            # Validate that the length is equal to shape dimensionality
-            if len(param) != shape.shape[0]:
-                raise ValueError(
-                    f"<{param_name}> parameter has length different "
-                    "from shape dimensionality")
-        else:
+        param = np.array(param, dtype=float)
+
+        if param.size == 0:
             raise ValueError(f"<{param_name}> parameter cannot be empty")
+        # If param is of length 1, no validation against shape
+        if param.size == 1:
+            return np.full(ndim, param.item())
+        # Else, validate that the length is equal to shape dimensionality
+        if param.shape != (ndim,):
+            raise ValueError(
+                f"<{param_name}> parameter has length different "
+                "from shape dimensionality")
+
+        return param
+
+    def _validate_stddev(self,
+                         stddev: ty.Union[float, ty.List[float]]) \
+            -> np.ndarray:
+        """Validates the stddev parameter like _validate_param() and
+        additionally validates that all its values are positive.
 
-        return np.array(param)
+        Parameters
+        ----------
+        stddev : list(float) or float
+            standard deviation of the pattern
 
-    def _update(self) -> None:
-        """Set the value of the changed flag Var to True"""
-        self.changed.set(np.array([True]))
+        Returns
+        -------
+        stddev : numpy.ndarray
 
-        # TODO: (GK) Remove when set() function blocks until it is complete
-        # To make sure parameter was set
-        self.changed.get()
+        """
+        stddev = self._validate_param(self._ndim, "stddev", stddev)
+
+        if np.any(stddev <= 0):
+            raise ValueError(f"<stddev> parameter must be positive but is "
+                             f"{stddev}")
+
+        return stddev
 
     @property
     def shape(self) -> ty.Union[np.ndarray, None]:
@@ -152,7 +172,11 @@ class GaussPattern(AbstractProcess):
         #  to make sure parameter was set
         self._amplitude.get()
 
-        self._update()
+        self.changed.set(_CHANGED_TRUE)
+
+        # TODO: (GK) Remove when set blocks until complete to make sure
+        #  changed flag was set
+        self.changed.get()
 
     @property
     def mean(self) -> ty.Union[np.ndarray, None]:
@@ -172,14 +196,18 @@ class GaussPattern(AbstractProcess):
     @mean.setter
     def mean(self, mean: ty.Union[float, ty.List[float]]) -> None:
         """Set the value of the mean Var and updates the changed flag"""
-        mean = self._validate_param(self.shape, "mean", mean)
+        mean = self._validate_param(self._ndim, "mean", mean)
         self._mean.set(mean)
 
         # TODO: (GK) Remove when set blocks until complete
         #  to make sure parameter was set
         self._mean.get()
 
-        self._update()
+        self.changed.set(_CHANGED_TRUE)
+
+        # TODO: (GK) Remove when set blocks until complete to make sure
+        #  changed flag was set
+        self.changed.get()
 
     @property
     def stddev(self) -> ty.Union[np.ndarray, None]:
@@ -199,11 +227,15 @@ class GaussPattern(AbstractProcess):
     @stddev.setter
     def stddev(self, stddev: ty.Union[float, ty.List[float]]) -> None:
         """Set the value of the stddev Var and updates the changed flag"""
-        stddev = self._validate_param(self.shape, "stddev", stddev)
+        stddev = self._validate_stddev(stddev)
         self._stddev.set(stddev)
 
         # TODO: (GK) Remove when set blocks until complete to make sure
         #  parameter was set
         self._stddev.get()
 
-        self._update()
+        self.changed.set(_CHANGED_TRUE)
+
+        # TODO: (GK) Remove when set blocks until complete to make sure
+        #  changed flag was set
+        self.changed.get()
@@ -15,12 +15,6 @@ class ReduceMethod(Enum):
     SUM = auto()  # ReduceDims will sum all synaptic weights of collapsed dim
     MEAN = auto()  # ReduceDims will compute mean of weights of collapsed dim
 
-    @classmethod
-    def validate(cls: Type[_T], reduce_method: ReduceMethod) -> None:
-        """Validate type of <reduce_op>"""
-        if not isinstance(reduce_method, ReduceMethod):
-            raise TypeError("reduce_method must be of type ReduceMethod")
-
 
 @unique
 class BorderType(Enum):
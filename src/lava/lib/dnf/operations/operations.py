@@ -3,8 +3,10 @@
 # See: https://spdx.org/licenses/
 
 from abc import ABC, abstractmethod
+import functools
 import typing as ty
 import numpy as np
+import scipy.sparse
 
 from lava.lib.dnf.utils.convenience import num_neurons
 from lava.lib.dnf.operations.shape_handlers import (
@@ -44,7 +46,7 @@ class AbstractOperation(ABC):
         """Return the output shape of the operation"""
         return self._shape_handler.input_shape
 
-    def compute_weights(self) -> np.ndarray:
+    def compute_weights(self) -> ty.Union[np.ndarray, scipy.sparse.spmatrix]:
         """
         Computes the connectivity weight matrix of the operation.
         This public method only validates the configuration of the
@@ -53,7 +55,9 @@ class AbstractOperation(ABC):
 
         Returns
         -------
-        connectivity weight matrix : numpy.ndarray
+        connectivity weight matrix : numpy.ndarray or scipy.sparse.spmatrix
+            operations with sparse connectivity may return a sparse matrix;
+            use toarray() on it if a dense matrix is required
 
         """
         # Assert that the input and output shape is configured
@@ -76,14 +80,14 @@ class AbstractOperation(ABC):
         self._shape_handler.configure(input_shape)
 
     @abstractmethod
-    def _compute_weights(self) -> np.ndarray:
+    def _compute_weights(self) -> ty.Union[np.ndarray, scipy.sparse.spmatrix]:
         """
         Does the actual work of computing the weights and returns them as a
-        numpy array.
+        numpy array or a scipy sparse matrix.
 
         Returns
         -------
-        weights : numpy.ndarray
+        weights : numpy.ndarray or scipy.sparse.spmatrix
 
         """
         pass
@@ -113,10 +117,13 @@ class Weights(AbstractOperation):
         super().__init__(KeepShapeHandler())
         self.weight = weight
 
-    def _compute_weights(self) -> np.ndarray:
-        return np.eye(num_neurons(self.output_shape),
-                      num_neurons(self.input_shape),
-                      dtype=np.int32) * self.weight
+    def _compute_weights(self) -> scipy.sparse.spmatrix:
+        # One-to-one connectivity only has entries on the diagonal, so store
+        # only those instead of a dense (num_neurons x num_neurons) matrix
+        return scipy.sparse.eye(num_neurons(self.output_shape),
+                                num_neurons(self.input_shape),
+                                dtype=np.int32,
+                                format="dia") * self.weight
 
 
 class ReduceDims(AbstractOperation):
@@ -137,25 +144,25 @@ class ReduceDims(AbstractOperation):
                  reduce_method: ty.Optional[ReduceMethod] = ReduceMethod.SUM
                  ) -> None:
         super().__init__(ReduceDimsHandler(reduce_dims))
-        ReduceMethod.validate(reduce_method)
-        self.reduce_method = reduce_method
+        # Looking up the value accepts ReduceMethod members as well as their
+        # values and raises a ValueError for anything else
+        self.reduce_method = ReduceMethod(reduce_method)
+
+    def _compute_weights(self) -> scipy.sparse.spmatrix:
+        input_shape = self.input_shape
 
-    def _compute_weights(self) -> np.ndarray:
         # Indices of the input dimensions in the weight matrix
         # that will not be removed
-        in_axes_all = np.arange(num_dims(self.input_shape))
-
         sh = ty.cast(ReduceDimsHandler, self._shape_handler)
-        in_axes_kept = tuple(np.delete(in_axes_all, sh.reduce_dims))
 
         # Generate the weight matrix
-        weights = _project_dims(self.input_shape,
+        weights = _project_dims(input_shape,
                                 self.output_shape,
-                                in_axes_kept=in_axes_kept)
+                                in_axes_kept=sh.kept_dims)
 
         if self.reduce_method == ReduceMethod.MEAN:
             # Set the weights such that they compute the mean
-            weights = weights / num_neurons(self.input_shape)
+            weights = weights / num_neurons(input_shape)
 
         return weights
 
@@ -170,10 +177,10 @@ class ExpandDims(AbstractOperation):
                  new_dims_shape: ty.Union[int, ty.Tuple[int, ...]]) -> None:
         super().__init__(ExpandDimsHandler(new_dims_shape))
 
-    def _compute_weights(self) -> np.ndarray:
+    def _compute_weights(self) -> scipy.sparse.spmatrix:
         # Indices of the output dimensions in the weight matrix that will
         # be kept from the input
-        out_axes_kept = tuple(np.arange(num_dims(self.input_shape)))
+        out_axes_kept = tuple(range(num_dims(self.input_shape)))
 
         # Generate the weight matrix
         weights = _project_dims(self.input_shape,
@@ -197,12 +204,13 @@ class Reorder(AbstractOperation):
     def __init__(self, order: ty.Tuple[int, ...]) -> None:
         super().__init__(ReorderHandler(order))
 
-    def _compute_weights(self) -> np.ndarray:
+    def _compute_weights(self) -> scipy.sparse.spmatrix:
         sh = ty.cast(ReorderHandler,
                      self._shape_handler)
+        # Output dimension i is input dimension order[i] (see ReorderHandler)
         weights = _project_dims(self.input_shape,
                                 self.output_shape,
-                                out_axes_kept=sh.order)
+                                in_axes_kept=sh.order)
 
         return weights
 
@@ -212,10 +220,14 @@ def _project_dims(
     output_shape: ty.Tuple[int, ...],
     out_axes_kept: ty.Optional[ty.Tuple[int, ...]] = None,
     in_axes_kept: ty.Optional[ty.Tuple[int, ...]] = None
-) -> np.ndarray:
+) -> scipy.sparse.spmatrix:
     """Projection function that is used both by the ReduceDims and ExpandDims
     Operation
 
+    The connectivity only depends on the (hashable) arguments, so it is
+    cached across operations; each call returns a copy that may be
+    modified without affecting the cache.
+
     Parameters
     ----------
     input_shape : tuple(int)
@@ -231,9 +243,39 @@ def _project_dims(
 
     Returns
     -------
-    connectivity weight matrix : numpy.ndarray
+    connectivity weight matrix : scipy.sparse.spmatrix
+        in CSR or CSC format
 
     """
+    # Arguments may be given as lists; the cache requires hashable tuples
+    if out_axes_kept is not None:
+        out_axes_kept = tuple(out_axes_kept)
+    if in_axes_kept is not None:
+        in_axes_kept = tuple(in_axes_kept)
+
+    # The cached connectivity is binary and stored as int8; promote the copy
+    # to float such that multiplying connectivity matrices cannot overflow
+    return _project_dims_cached(tuple(input_shape),
+                                tuple(output_shape),
+                                out_axes_kept,
+                                in_axes_kept).astype(np.float64)
+
+
+# The cache is bounded by the number of entries, not by their size. Each
+# entry holds the complete connectivity of a projection at about 5 bytes per
+# connection (e.g., about 10 MB for ExpandDims from (200, 200) to
+# (200, 200, 50)), and every call additionally returns a float64 copy at
+# about 12 bytes per connection. The cache is thus kept small.
+@functools.lru_cache(maxsize=4)
+def _project_dims_cached(
+    input_shape: ty.Tuple[int, ...],
+    output_shape: ty.Tuple[int, ...],
+    out_axes_kept: ty.Optional[ty.Tuple[int, ...]],
+    in_axes_kept: ty.Optional[ty.Tuple[int, ...]]
+) -> scipy.sparse.spmatrix:
+    """Computes the connectivity for _project_dims(), which also describes
+    the parameters; the returned binary int8 matrix is shared between calls
+    and must not be modified."""
     num_neurons_in = num_neurons(input_shape)
     num_neurons_out = num_neurons(output_shape)
     num_dims_in = num_dims(input_shape)
@@ -242,63 +284,147 @@ def _project_dims(
 
     if smaller_num_dims == 0:
         # If the target is a 0D population, the connectivity is from
-        # all neurons in the source population to that one neuron
-        weights = np.ones((num_neurons_out, num_neurons_in))
+        # all neurons in the source population to that one neuron; no
+        # dimension is kept
+        out_axes_kept = ()
+        in_axes_kept = ()
     else:
-        # Create a dense connectivity matrix, where dimensions of the
-        # source and target are not yet flattened
-        shape = output_shape + input_shape
-        weights = np.zeros(shape)
-
-        ###
-        # The following lines create a view on the connectivity matrix,
-        # in which the axes are moved such that the first dimensions are all
-        # output dimensions that will be kept, followed by all input
-        # dimensions that will be kept, followed by all remaining dimensions.
         if in_axes_kept is None:
-            in_axes_kept = np.arange(num_dims_in)
-        in_axes_kept = tuple(np.asarray(in_axes_kept) + num_dims_out)
-
+            in_axes_kept = tuple(range(num_dims_in))
         if out_axes_kept is None:
-            out_axes_kept = np.arange(num_dims_out)
-        out_axes_kept = tuple(out_axes_kept)
+            out_axes_kept = tuple(range(num_dims_out))
+
+        # Convert negative indices of axes into positive ones
+        in_axes_kept = tuple(a % len(input_shape) for a in in_axes_kept)
+        out_axes_kept = tuple(a % len(output_shape) for a in out_axes_kept)
+
+    # The kept dimensions are paired in order and must match in size
+    kept_shape_out = tuple(output_shape[a] for a in out_axes_kept)
+    kept_shape_in = tuple(input_shape[a] for a in in_axes_kept)
+    if kept_shape_out != kept_shape_in:
+        raise ValueError(f"kept dimensions of the output {kept_shape_out} "
+                         f"do not match the kept dimensions of the input "
+                         f"{kept_shape_in}")
+
+    leading_axes = tuple(range(len(out_axes_kept)))
+    if out_axes_kept == leading_axes and in_axes_kept == leading_axes:
+        # If the kept dimensions are the leading dimensions of both the
+        # source and the target, the connectivity is block diagonal: for
+        # every index along the kept dimensions, all remaining target
+        # neurons are connected to all remaining source neurons
+        num_kept = num_neurons(kept_shape_out)
+        if num_kept == num_neurons_out == num_neurons_in:
+            # All dimensions are kept in order (e.g., a Reorder that does
+            # not change the order), which yields one-to-one connectivity
+            return scipy.sparse.identity(num_kept,
+                                         dtype=np.int8,
+                                         format="csr")
+
+        block = np.ones((num_neurons_out // num_kept,
+                         num_neurons_in // num_kept), dtype=np.int8)
+        if num_kept == 1:
+            # No dimension is kept (e.g., reducing to 0D), which yields
+            # all-to-all connectivity
+            return _compressed(scipy.sparse.coo_matrix(block))
+
+        return _compressed(scipy.sparse.kron(
+            scipy.sparse.identity(num_kept, dtype=np.int8),
+            block,
+            format="coo"))
+
+    # All dimensions that are not kept are connected all-to-all
+    out_axes_free = tuple(a for a in range(len(output_shape))
+                          if a not in out_axes_kept)
+    in_axes_free = tuple(a for a in range(len(input_shape))
+                         if a not in in_axes_kept)
+
+    # Flat indices of all target neurons, arranged as a (kept, free) matrix
+    # in which the first axis combines all kept dimensions and the second
+    # axis combines all remaining dimensions of the target
+    rows = _flat_indices(output_shape, out_axes_kept, out_axes_free)
+    # Same for the source neurons
+    cols = _flat_indices(input_shape, in_axes_kept, in_axes_free)
+
+    ###
+    # Every target neuron is connected to every source neuron that shares
+    # its index along the kept dimensions. Viewing the connectivity as a
+    # three-dimensional (kept, free target, free source) block, the row and
+    # column indices of all non-zero entries can thus be broadcast instead
+    # of being computed for every entry separately.
+    num_kept, num_out_free = rows.shape
+    num_in_free = cols.shape[1]
+    block_shape = (num_kept, num_out_free, num_in_free)
+    rows = np.broadcast_to(rows[:, :, np.newaxis], block_shape).ravel()
+    cols = np.broadcast_to(cols[:, np.newaxis, :], block_shape).ravel()
+    #
+    ###
+
+    weights = scipy.sparse.coo_matrix((np.ones(rows.size, dtype=np.int8),
+                                       (rows, cols)),
+                                      shape=(num_neurons_out, num_neurons_in))
+
+    return _compressed(weights)
+
+
+def _compressed(weights: scipy.sparse.spmatrix) -> scipy.sparse.spmatrix:
+    """Converts a weight matrix into the compressed sparse format (CSR or
+    CSC) with the shorter index pointer array. Unlike the COO format, which
+    stores a row and a column index for every non-zero entry, this stores
+    a single index per entry, plus one pointer per row (CSR) or column
+    (CSC).
 
-        # New indices of the kept output dimensions after moving the axes
-        new_axes_out = tuple(np.arange(len(out_axes_kept)))
-        # New indices of the kept input dimensions after moving the axes
-        new_axes_in = tuple(np.arange(len(in_axes_kept)) + len(new_axes_out))
-
-        # Create the view by moving the axes
-        conn = np.moveaxis(weights,
-                           out_axes_kept + in_axes_kept,
-                           new_axes_out + new_axes_in)
-        #
-        ###
-
-        # For each source-target dimension pair, set connections to 1 for
-        # every pair of neurons along that dimension, as well as to all
-        # neurons in all remaining dimensions
-        if smaller_num_dims == 1:
-            for a in range(np.size(conn, axis=0)):
-                conn[a, a, ...] = 1
-        elif smaller_num_dims == 2:
-            for a in range(np.size(conn, axis=0)):
-                for b in range(np.size(conn, axis=1)):
-                    conn[a, b, a, b, ...] = 1
-        elif smaller_num_dims == 3:
-            for a in range(np.size(conn, axis=0)):
-                for b in range(np.size(conn, axis=1)):
-                    for c in range(np.size(conn, axis=2)):
-                        conn[a, b, c, a, b, c, ...] = 1
-        else:
-            raise NotImplementedError("projection is not implemented for "
-                                      "dimensionality > 3")
+    Parameters
+    ----------
+    weights : scipy.sparse.spmatrix
+        weight matrix
+
+    Returns
+    -------
+    weights : scipy.sparse.spmatrix
+        weight matrix in CSR or CSC format
+
+    """
+    num_rows, num_cols = weights.shape
+    return weights.tocsr() if num_rows <= num_cols else weights.tocsc()
+
+
+def _flat_indices(
+    shape: ty.Tuple[int, ...],
+    axes_kept: ty.Tuple[int, ...],
+    axes_free: ty.Tuple[int, ...]
+) -> np.ndarray:
+    """Computes the flat indices of all elements of an array with the given
+    shape and arranges them such that the first axis of the result
+    enumerates the kept axes and the second axis enumerates the free axes.
+
+    Parameters
+    ----------
+    shape : tuple(int)
+        shape of the array
+    axes_kept : tuple(int)
+        indices of the axes that are kept
+    axes_free : tuple(int)
+        indices of all remaining axes
+
+    Returns
+    -------
+    flat indices : numpy.ndarray
+        two-dimensional array of shape (number of elements along the kept
+        axes, number of elements along the free axes)
+
+    """
+    kept_shape = tuple(shape[a] for a in axes_kept)
+    free_shape = tuple(shape[a] for a in axes_free)
+
+    grid = np.indices(kept_shape + free_shape)
+    grid = grid.reshape(len(shape), num_neurons(kept_shape), -1)
 
-        # Flatten the source and target dimensions of the connectivity
-        # matrix to get a two-dimensional dense connectivity matrix
-        weights = weights.reshape((num_neurons_out, num_neurons_in))
+    # Sort the grid back into the original order of the axes
+    multi_index = [None] * len(shape)
+    for i, a in enumerate(axes_kept + axes_free):
+        multi_index[a] = grid[i]
 
-    return weights
+    return np.ravel_multi_index(tuple(multi_index), shape)
 
 
 class Convolution(AbstractOperation):
@@ -402,14 +528,14 @@ class Convolution(AbstractOperation):
         for i in range(num_dims):
             # Compute the size difference between the population and the
             # kernel in the current dimension
-            size_diff = shape[i] - np.size(kernel_weights, axis=i)
+            size_diff = shape[i] - kernel_weights.shape[i]
 
             if size_diff != 0:
                 pad_width = np.zeros((num_dims, 2), dtype=int)
                 pad_width[i, :] = int(np.floor(np.abs(size_diff) / 2.0))
                 # If the padding cannot be distributed evenly...
                 if is_odd(size_diff):
-                    if is_odd(np.size(kernel_weights, axis=i)):
+                    if is_odd(kernel_weights.shape[i]):
                         # ...add one in front if the kernel size is odd...
                         pad_width[i, 0] += 1
                     else:
@@ -459,7 +585,7 @@ class Convolution(AbstractOperation):
 
                     # If the connection weight matrix is too large for the
                     # population...
-                    size_diff = shape[i] - np.size(conn_weights, axis=i)
+                    size_diff = shape[i] - conn_weights.shape[i]
                     if size_diff < 0:
                         # ...delete the overflowing elements
                         conn_weights = np.delete(conn_weights,
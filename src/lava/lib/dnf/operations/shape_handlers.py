@@ -4,7 +4,6 @@
 
 from abc import ABC, abstractmethod
 import typing as ty
-import numpy as np
 
 from lava.lib.dnf.utils.convenience import num_neurons
 from lava.lib.dnf.operations.exceptions import MisconfiguredOpError
@@ -12,12 +11,21 @@ from lava.lib.dnf.operations.exceptions import MisconfiguredOpError
 from lava.lib.dnf.utils.convenience import num_dims
 
 
+# Output shapes of configured shape handlers, keyed by the type of the
+# handler, its arguments, and its input shape (see
+# AbstractShapeHandler.configure())
+_configured_output_shapes: ty.Dict[ty.Tuple, ty.Tuple[int, ...]] = {}
+_MAX_CONFIGURED_SHAPES = 1024
+
+
 class AbstractShapeHandler(ABC):
     """
     Abstract class for handling input and output shape of the
     AbstractOperation class.
 
     """
+    __slots__ = ("_input_shape", "_output_shape")
+
     def __init__(self) -> None:
         self._input_shape = None
         self._output_shape = None
@@ -34,6 +42,32 @@ class AbstractShapeHandler(ABC):
             input shape of an operation
 
         """
+        args = self._args()
+        if args is None:
+            self._configure(input_shape)
+            return
+
+        # The output shape only depends on the type of the handler, its
+        # arguments and the input shape, so it is computed (and validated)
+        # once for each combination
+        key = (type(self), args, tuple(input_shape))
+        output_shape = _configured_output_shapes.get(key)
+        if output_shape is None:
+            # Raises on invalid configurations, which are thus not cached
+            self._configure(input_shape)
+            if len(_configured_output_shapes) >= _MAX_CONFIGURED_SHAPES:
+                # Evict the oldest entry
+                del _configured_output_shapes[
+                    next(iter(_configured_output_shapes))]
+            _configured_output_shapes[key] = self._output_shape
+        else:
+            self._input_shape = input_shape
+            self._output_shape = output_shape
+
+    def _configure(self,
+                   input_shape: ty.Tuple[int, ...]) -> None:
+        """Validates the input shape and arguments and computes the output
+        shape."""
         self._validate_input_shape(input_shape)
         self._input_shape = input_shape
         # Validate any arguments that subclass shape handlers may receive
@@ -46,6 +80,12 @@ class AbstractShapeHandler(ABC):
             raise AssertionError("_input_shape and _output_shape "
                                  "should not be None")
 
+    def _args(self) -> ty.Optional[ty.Tuple]:
+        """Return a hashable tuple of all arguments that the output shape
+        depends on besides the input shape, or None if the configuration of
+        the handler may not be cached."""
+        return None
+
     @property
     def output_shape(self) -> ty.Tuple[int, ...]:
         """Return the output shape of the handler"""
@@ -72,7 +112,16 @@ class AbstractShapeHandler(ABC):
 
 class KeepShapeHandler(AbstractShapeHandler):
     """Shape handler for operations that do not change the shape of the
-     input."""
+     input. The output shape is the input shape object itself (not a copy),
+     so that both can be compared by identity."""
+    __slots__ = ()
+
+    def configure(self,
+                  input_shape: ty.Tuple[int, ...]) -> None:
+        # There is nothing to validate or compute; the output shape is the
+        # input shape
+        self._input_shape = self._output_shape = input_shape
+
     def _compute_output_shape(self) -> None:
         self._output_shape = self._input_shape
 
@@ -94,6 +143,8 @@ class ReduceDimsHandler(AbstractShapeHandler):
     reduce_dims : int or tuple(int)
         indices of the dimensions to remove
     """
+    __slots__ = ("_reduce_dims",)
+
     def __init__(self,
                  reduce_dims: ty.Union[int, ty.Tuple[int, ...]]) -> None:
         super().__init__()
@@ -106,11 +157,24 @@ class ReduceDimsHandler(AbstractShapeHandler):
         """Return the output shape of the handler"""
         return self._reduce_dims
 
+    def _args(self) -> ty.Optional[ty.Tuple]:
+        return (tuple(self._reduce_dims),)
+
+    @property
+    def kept_dims(self) -> ty.Tuple[int, ...]:
+        """Return the (positive) indices of the input dimensions that are
+        not removed; requires the handler to be configured"""
+        num_dims_in = len(self._input_shape)
+        # Positive indices of the dimensions that will be removed
+        reduce_dims = {idx % num_dims_in for idx in self._reduce_dims}
+
+        return tuple(idx for idx in range(num_dims_in)
+                     if idx not in reduce_dims)
+
     def _compute_output_shape(self) -> None:
-        self._output_shape = tuple(np.delete(np.asarray(self._input_shape),
-                                             self.reduce_dims))
-        if self._output_shape == ():
-            self._output_shape = (1,)
+        # Reducing all dimensions yields a zero-dimensional shape (1,)
+        self._output_shape = tuple(self._input_shape[idx]
+                                   for idx in self.kept_dims) or (1,)
 
     def _validate_input_shape(self, input_shape: ty.Tuple[int, ...]) -> None:
         if num_dims(input_shape) == 0:
@@ -128,13 +192,9 @@ class ReduceDimsHandler(AbstractShapeHandler):
                              f"more entries than the shape of the input "
                              f"{self._input_shape}")
 
-        for idx in self.reduce_dims:
-            # Compute the positive index irrespective of the sign of 'idx'
-            idx_positive = len(self._input_shape) + idx if idx < 0 else idx
-            # Make sure the positive index is not out of bounds
-            if idx_positive < 0 or idx_positive >= len(self._input_shape):
-                raise IndexError(f"<reduce_dims> value {idx} is out of bounds "
-                                 f"for array of size {len(self._input_shape)}")
+        _validate_indices(self.reduce_dims,
+                          len(self._input_shape),
+                          "reduce_dims")
 
 
 class ExpandDimsHandler(AbstractShapeHandler):
@@ -149,6 +209,8 @@ class ExpandDimsHandler(AbstractShapeHandler):
         of the input, for instance an input shape (2,) and
         new_dims_shape=(6, 8) will produce an output shape (2, 6, 8)
     """
+    __slots__ = ("_new_dims_shape",)
+
     def __init__(self,
                  new_dims_shape: ty.Union[int, ty.Tuple[int, ...]]) -> None:
         super().__init__()
@@ -161,19 +223,28 @@ class ExpandDimsHandler(AbstractShapeHandler):
         """Return the <new_dims_shape> attribute"""
         return self._new_dims_shape
 
+    def _args(self) -> ty.Optional[ty.Tuple]:
+        return (tuple(self._new_dims_shape),)
+
     def _compute_output_shape(self) -> None:
-        if num_dims(self.input_shape) == 0:
-            self._output_shape = self.new_dims_shape
+        # The most common zero-dimensional input shape is (1,)
+        if self._input_shape == (1,):
+            num_dims_in = 0
         else:
-            self._output_shape = self.input_shape + self.new_dims_shape
+            num_dims_in = num_dims(self._input_shape)
 
-        if len(self._output_shape) > 3:
+        if num_dims_in + len(self._new_dims_shape) > 3:
             raise NotImplementedError("ExpandDims operation is configured to "
                                       "produce an output shape with "
                                       "dimensionality larger than 3; higher "
                                       "dimensionality is currently not "
                                       "supported")
 
+        if num_dims_in == 0:
+            self._output_shape = self._new_dims_shape
+        else:
+            self._output_shape = self._input_shape + self._new_dims_shape
+
     def _validate_args(self) -> None:
         """Validate the <new_dims_shape> argument"""
         if len(self.new_dims_shape) == 0:
@@ -197,10 +268,15 @@ class ReshapeHandler(AbstractShapeHandler):
         output shape of an operation
 
     """
+    __slots__ = ()
+
     def __init__(self, output_shape: ty.Tuple[int, ...]) -> None:
         super().__init__()
         self._output_shape = output_shape
 
+    def _args(self) -> ty.Optional[ty.Tuple]:
+        return (tuple(self._output_shape),)
+
     def _validate_args(self) -> None:
         if num_neurons(self._input_shape) != num_neurons(self._output_shape):
             raise MisconfiguredOpError("input and output shape must have the "
@@ -224,6 +300,8 @@ class ReorderHandler(AbstractShapeHandler):
         must have the same number of elements as the input and output shape
 
     """
+    __slots__ = ("_order",)
+
     def __init__(self, order: ty.Tuple[int, ...]) -> None:
         super().__init__()
         self._order = order
@@ -233,13 +311,18 @@ class ReorderHandler(AbstractShapeHandler):
         """Return the order of the handler"""
         return self._order
 
+    def _args(self) -> ty.Optional[ty.Tuple]:
+        return (tuple(self._order),)
+
     def _compute_output_shape(self) -> None:
-        input_shape = np.array(self._input_shape)
-        self._output_shape = tuple(input_shape[list(self._order)])
+        self._output_shape = tuple(self._input_shape[idx]
+                                   for idx in self._order)
 
     def _validate_args(self) -> None:
         """Validate the <order> argument"""
-        num_dims_in = num_dims(self._input_shape)
+        # The input shape is validated to be at least two-dimensional, so
+        # its length is its dimensionality
+        num_dims_in = len(self._input_shape)
 
         if len(self._order) != num_dims_in:
             raise MisconfiguredOpError("<order> must have the same number of "
@@ -247,13 +330,7 @@ class ReorderHandler(AbstractShapeHandler):
                                        f"len({self._order}) != len("
                                        f"{self._input_shape})")
 
-        for idx in self._order:
-            # Compute the positive index irrespective of the sign of 'idx'
-            idx_positive = len(self._input_shape) + idx if idx < 0 else idx
-            # Make sure the positive index is not out of bounds
-            if idx_positive < 0 or idx_positive >= len(self._input_shape):
-                raise IndexError(f"<order> value {idx} is out of bounds "
-                                 f"for array of size {len(self._input_shape)}")
+        _validate_indices(self._order, num_dims_in, "order")
 
     def _validate_input_shape(self, input_shape: ty.Tuple[int, ...]) -> None:
         num_dims_in = num_dims(input_shape)
@@ -262,3 +339,27 @@ class ReorderHandler(AbstractShapeHandler):
             raise MisconfiguredOpError("the input dimensionality "
                                        "is smaller than 2; there are no "
                                        "dimensions to reorder")
+
+
+def _validate_indices(indices: ty.Tuple[int, ...],
+                      size: int,
+                      name: str) -> None:
+    """Validates that all (possibly negative) indices are within bounds for
+    an array of the given size.
+
+    Parameters
+    ----------
+    indices : tuple(int)
+        indices to validate
+    size : int
+        size of the array that is indexed
+    name : str
+        name of the argument that holds the indices
+
+    """
+    # Negative indices are valid down to -size, so a single chained
+    # comparison covers both signs without normalizing each index first
+    out_of_bounds = [idx for idx in indices if not -size <= idx < size]
+    if out_of_bounds:
+        raise IndexError(f"<{name}> value {out_of_bounds[0]} is out of bounds "
+                         f"for array of size {size}")
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # See: https://spdx.org/licenses/
 
+import math
 import numpy as np
 import typing as ty
 
@@ -20,7 +21,8 @@ def num_neurons(shape: ty.Tuple[int, ...]) -> int:
     num_neurons : int
         number of neurons
     """
-    return int(np.prod(shape))
+    # math.prod avoids converting the (small) shape tuple to an array
+    return int(math.prod(shape))
 
 
 def num_dims(shape: ty.Tuple[int, ...]) -> int:
@@ -43,6 +45,28 @@ def num_dims(shape: ty.Tuple[int, ...]) -> int:
     return dims
 
 
+def shapes_equal(shape_a: ty.Tuple[int, ...],
+                 shape_b: ty.Tuple[int, ...]) -> bool:
+    """
+    Checks whether two shapes are equal. Shapes that are the same object,
+    for instance the input and output shape of an operation that keeps the
+    shape, are equal without comparing their entries.
+
+    Parameters
+    ----------
+    shape_a : tuple(int)
+        first shape
+    shape_b : tuple(int)
+        second shape
+
+    Returns
+    -------
+    equal : bool
+        True if the shapes are equal
+    """
+    return shape_a is shape_b or shape_a == shape_b
+
+
 def to_ndarray(
     x: ty.Union[float, ty.Tuple, ty.List, np.ndarray]
 ) -> np.ndarray:
@@ -4,7 +4,6 @@
 
 import numpy as np
 import typing as ty
-import scipy.stats
 
 
 def gauss(shape: ty.Tuple[int, ...],
@@ -49,11 +48,8 @@ def gauss(shape: ty.Tuple[int, ...],
     # Dimensionality of the Gaussian
     dimensionality = len(shape)
 
-    # Domain defaults to the indices of the sampling points
-    if domain is None:
-        domain = np.zeros((dimensionality, 2))
-        domain[:, 1] = np.array(shape[:]) - 1
-    else:
+    # Domain defaults to the indices of the sampling points (see gauss_grid)
+    if domain is not None:
         if isinstance(domain, np.ndarray) and domain.shape != (len(shape), 2):
             raise ValueError("the shape of <domain> is incompatible with "
                              "the specified <shape>; <domain> should be of "
@@ -76,32 +72,111 @@ def gauss(shape: ty.Tuple[int, ...],
             raise ValueError("the shape of <stddev> is incompatible with "
                              "the specified <shape>; <stddev> should be of "
                              f"shape ({len(shape)},) but is {stddev.shape}")
+        if np.any(np.asarray(stddev) <= 0):
+            raise ValueError(f"<stddev> must be positive but is {stddev}")
+
+    grid = gauss_grid(shape, domain)
+
+    return evaluate_gauss(grid, amplitude, mean, stddev)
+
+
+def gauss_grid(shape: ty.Tuple[int, ...],
+               domain: ty.Optional[np.ndarray] = None
+               ) -> ty.Sequence[np.ndarray]:
+    """
+    Computes the positions of the sampling points at which gauss() evaluates
+    the Gaussian function. The grid only depends on the shape and the domain
+    and can thus be reused to evaluate Gaussians with different parameters.
+
+    Parameters
+    ----------
+    shape : tuple(int)
+        number of sampling points along each dimension
+    domain : numpy.ndarray, optional
+        lower and upper bound of input values for each dimension; defaults
+        to the indices of the sampling points
+
+    Returns
+    -------
+    grid : list(numpy.ndarray)
+        coordinates of the sampling points along each dimension; the arrays
+        are shaped such that they broadcast against each other to <shape>
+    """
+    # Domain defaults to the indices of the sampling points
+    if domain is None:
+        domain = np.zeros((len(shape), 2))
+        domain[:, 1] = np.array(shape[:]) - 1
 
     # Create linear spaces for each dimension
-    linspaces = []
-    for i in range(dimensionality):
-        linspaces.append(np.linspace(domain[i, 0], domain[i, 1], shape[i]))
-
-    # Arrange linear spaces into a meshgrid
-    linspaces = np.array(linspaces, dtype=object)
-    grid = np.meshgrid(*linspaces, copy=False)
-    grid = np.array(grid)
-
-    # Swap axes to get around perculiarity of meshgrid
-    if dimensionality > 1:
-        grid = np.swapaxes(grid, 1, 2)
-
-    # Reshape meshgrid to fit multi-variate normal
-    grid = np.moveaxis(grid, 0, -1)
-
-    # Compute normal probability density function
-    mv_normal_pdf = scipy.stats.multivariate_normal.pdf(grid,
-                                                        mean=mean,
-                                                        cov=stddev)
-    # Normalize probability density function and apply amplitude
-    gaussian = amplitude * mv_normal_pdf / np.max(mv_normal_pdf)
-
-    return gaussian
+    linspaces = [np.linspace(domain[i, 0], domain[i, 1], shape[i])
+                 for i in range(len(shape))]
+
+    # Arrange linear spaces into an open grid, which does not repeat the
+    # coordinates for every sampling point
+    grid = np.meshgrid(*linspaces, indexing="ij", sparse=True)
+
+    return grid
+
+
+def evaluate_gauss(grid: ty.Sequence[np.ndarray],
+                   amplitude: float,
+                   mean: ty.Union[float, np.ndarray],
+                   stddev: ty.Union[float, np.ndarray],
+                   out: ty.Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Evaluates the Gaussian function at the sampling points of a grid
+    computed by gauss_grid(). The Gaussian is normalized such that its
+    maximum value over the grid equals the amplitude.
+
+    Parameters
+    ----------
+    grid : list(numpy.ndarray)
+        coordinates of the sampling points (see gauss_grid())
+    amplitude : float
+        amplitude of the Gaussian
+    mean : float or numpy.ndarray
+        mean of the Gaussian
+    stddev : float or numpy.ndarray
+        standard deviation of the Gaussian; its values are used as the
+        diagonal of the covariance matrix
+    out : numpy.ndarray, optional
+        array into which the result is written; avoids allocating a new
+        array when the Gaussian is evaluated repeatedly
+
+    Returns
+    -------
+    gaussian : numpy.ndarray
+        multi-dimensional array with samples of the Gaussian
+    """
+    dimensionality = len(grid)
+    mean = np.broadcast_to(mean, (dimensionality,))
+    stddev = np.broadcast_to(stddev, (dimensionality,))
+
+    # With a diagonal covariance matrix, the Gaussian is the product of
+    # one-dimensional Gaussians along each dimension. The exponential is
+    # thus only evaluated along each dimension and the results are combined
+    # by broadcasting. The normalization constant of the probability density
+    # function cancels out when normalizing by the maximum, which is the
+    # product of the maxima along each dimension.
+    factors = []
+    for coordinates, m, s in zip(grid, mean, stddev):
+        gaussian_1d = np.exp(-0.5 * (coordinates - m) ** 2 / s)
+        factors.append(gaussian_1d / np.max(gaussian_1d))
+    # Apply the amplitude to the (small) first factor
+    factors[0] = amplitude * factors[0]
+
+    if out is None:
+        out = np.empty(np.broadcast_shapes(*[f.shape for f in factors]))
+
+    # Only the multiplication of the factors touches every sampling point
+    if dimensionality == 1:
+        out[...] = factors[0]
+    else:
+        np.multiply(factors[0], factors[1], out=out)
+        for factor in factors[2:]:
+            np.multiply(out, factor, out=out)
+
+    return out
 
 
 def is_odd(n: int) -> bool:
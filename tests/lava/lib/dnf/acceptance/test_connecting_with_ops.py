@@ -131,20 +131,20 @@ class TestConnectingWithOperations(unittest.TestCase):
                               [0, 0, 0, 1],
                               [0, 0, 0, 1]]),
                     np.array([[1, 0, 0, 0],
-                              [0, 1, 0, 0],
                               [0, 0, 1, 0],
-                              [0, 0, 0, 1],
                               [1, 0, 0, 0],
-                              [0, 1, 0, 0],
                               [0, 0, 1, 0],
+                              [0, 1, 0, 0],
+                              [0, 0, 0, 1],
+                              [0, 1, 0, 0],
                               [0, 0, 0, 1]]),
                     np.array([[1, 0, 0, 0],
-                              [0, 0, 1, 0],
-                              [1, 0, 0, 0],
-                              [0, 0, 1, 0],
                               [0, 1, 0, 0],
+                              [0, 0, 1, 0],
                               [0, 0, 0, 1],
+                              [1, 0, 0, 0],
                               [0, 1, 0, 0],
+                              [0, 0, 1, 0],
                               [0, 0, 0, 1]]),
                     np.array([[1, 0, 0, 0],
                               [0, 0, 1, 0],
@@ -210,20 +210,20 @@ class TestConnectingWithOperations(unittest.TestCase):
                               [0, 1],
                               [0, 1]]),
                     np.array([[1, 0],
-                              [0, 1],
                               [1, 0],
                               [0, 1],
-                              [1, 0],
                               [0, 1],
                               [1, 0],
-                              [0, 1]]),
-                    np.array([[1, 0],
                               [1, 0],
                               [0, 1],
+                              [0, 1]]),
+                    np.array([[1, 0],
                               [0, 1],
                               [1, 0],
+                              [0, 1],
                               [1, 0],
                               [0, 1],
+                              [1, 0],
                               [0, 1]])]
 
         for order, expected in zip(orders, matrices):
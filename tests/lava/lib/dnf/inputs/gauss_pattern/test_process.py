@@ -72,6 +72,17 @@ class TestGaussPattern(unittest.TestCase):
                          mean=15.,
                          stddev=[5., 5., 5.])
 
+    def test_init_non_positive_stddev_raises_error(self) -> None:
+        """Tests whether a GaussPattern process instantiation with a stddev
+        that is not positive raises a ValueError."""
+        for stddev in [0., [5., 0.], [5., -1.]]:
+            with self.subTest(stddev=stddev):
+                with self.assertRaises(ValueError):
+                    GaussPattern(shape=(30, 30),
+                                 amplitude=200.,
+                                 mean=15.,
+                                 stddev=stddev)
+
     def test_running(self) -> None:
         """Tests whether a GaussPattern process can be run."""
         num_steps = 10
@@ -8,18 +8,18 @@ from lava.lib.dnf.operations.enums import ReduceMethod, BorderType
 
 
 class TestReduceMethod(unittest.TestCase):
-    def test_validate_sum(self) -> None:
-        """Tests whether SUM is a valid type of the ReduceMethod enum."""
-        ReduceMethod.validate(ReduceMethod.SUM)
-
-    def test_validate_mean(self) -> None:
-        """Tests whether MEAN is a valid type of the ReduceMethod enum."""
-        ReduceMethod.validate(ReduceMethod.MEAN)
-
-    def test_invalid_type_raises_type_error(self) -> None:
-        """Tests whether int is an invalid type of the ReduceMethod enum."""
-        with self.assertRaises(TypeError):
-            ReduceMethod.validate(int)
+    def test_lookup_sum(self) -> None:
+        """Tests whether SUM is a valid value of the ReduceMethod enum."""
+        self.assertIs(ReduceMethod(ReduceMethod.SUM), ReduceMethod.SUM)
+
+    def test_lookup_mean(self) -> None:
+        """Tests whether MEAN is a valid value of the ReduceMethod enum."""
+        self.assertIs(ReduceMethod(ReduceMethod.MEAN), ReduceMethod.MEAN)
+
+    def test_invalid_type_raises_value_error(self) -> None:
+        """Tests whether int is an invalid value of the ReduceMethod enum."""
+        with self.assertRaises(ValueError):
+            ReduceMethod(int)
 
     def test_invalid_value_raises_value_error(self) -> None:
         """Tests whether FOO is an invalid value of the ReduceMethod enum."""
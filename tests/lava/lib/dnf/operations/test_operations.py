@@ -4,6 +4,7 @@
 
 import unittest
 import numpy as np
+import scipy.sparse
 import typing as ty
 
 from lava.lib.dnf.operations.operations import (
@@ -98,7 +99,9 @@ class TestWeights(unittest.TestCase):
                                       num_neurons(shape),
                                       dtype=np.int32) * w
 
-            self.assertTrue(np.array_equal(computed_weights, expected_weights))
+            self.assertTrue(scipy.sparse.issparse(computed_weights))
+            self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                           expected_weights))
 
 
 class TestReduceDims(unittest.TestCase):
@@ -111,6 +114,12 @@ class TestReduceDims(unittest.TestCase):
         self.assertIsInstance(op, ReduceDims)
         self.assertEqual(op.reduce_method, reduce_method)
 
+    def test_invalid_reduce_method_raises_error(self) -> None:
+        """Tests whether an error is raised when <reduce_method> is not a
+        ReduceMethod."""
+        with self.assertRaises(ValueError):
+            ReduceDims(reduce_dims=0, reduce_method="sum")
+
     def test_compute_weights_2d_to_0d_sum(self) -> None:
         """Tests reducing dimensionality from 2D to 0D using SUM."""
         op = ReduceDims(reduce_dims=(0, 1),
@@ -119,7 +128,8 @@ class TestReduceDims(unittest.TestCase):
         computed_weights = op.compute_weights()
         expected_weights = np.ones((1, 9))
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
 
     def test_compute_weights_2d_to_0d_mean(self) -> None:
         """Tests reducing dimensionality from 2D to 0D using MEAN."""
@@ -129,7 +139,8 @@ class TestReduceDims(unittest.TestCase):
         computed_weights = op.compute_weights()
         expected_weights = np.ones((1, 9)) / 9.0
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
 
     def test_reduce_method_mean(self) -> None:
         """Tests whether MEAN produces the same results as SUM divided by the
@@ -146,8 +157,20 @@ class TestReduceDims(unittest.TestCase):
         op_mean.configure(input_shape=input_shape)
         computed_weights_mean = op_mean.compute_weights()
 
-        self.assertTrue(np.array_equal(computed_weights_mean,
-                                       computed_weights_sum / 9.0))
+        self.assertTrue(np.array_equal(computed_weights_mean.toarray(),
+                                       computed_weights_sum.toarray() / 9.0))
+
+    def test_compute_weights_returns_independent_matrices(self) -> None:
+        """Tests whether modifying computed weights does not affect the
+        weights that are computed later for the same configuration."""
+        op = ReduceDims(reduce_dims=(0,))
+        op.configure(input_shape=(3, 3))
+        weights = op.compute_weights()
+        expected_weights = weights.toarray()
+        weights.data[:] = 0
+
+        self.assertTrue(np.array_equal(op.compute_weights().toarray(),
+                                       expected_weights))
 
     def test_compute_weights_2d_to_1d_reduce_axis_0_sum(self) -> None:
         """Tests reducing dimension 0 from 2D to 1D using SUM."""
@@ -159,7 +182,8 @@ class TestReduceDims(unittest.TestCase):
                                      [0, 1, 0, 0, 1, 0, 0, 1, 0],
                                      [0, 0, 1, 0, 0, 1, 0, 0, 1]])
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
 
     def test_compute_weights_2d_to_1d_axis_reduce_axis_1_sum(self) -> None:
         """Tests reducing dimension 1 from 2D to 1D using SUM."""
@@ -171,7 +195,8 @@ class TestReduceDims(unittest.TestCase):
                                      [0, 0, 0, 1, 1, 1, 0, 0, 0],
                                      [0, 0, 0, 0, 0, 0, 1, 1, 1]])
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
 
     def test_compute_weights_3d_to_1d_axis_keep_axis_0_sum(self) -> None:
         """Tests reducing dimensions 1 and 2 from 3D to 1D using SUM."""
@@ -182,7 +207,8 @@ class TestReduceDims(unittest.TestCase):
         expected_weights = np.array([[1, 1, 1, 1, 0, 0, 0, 0],
                                      [0, 0, 0, 0, 1, 1, 1, 1]])
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
 
     def test_compute_weights_3d_to_1d_axis_keep_axis_1_sum(self) -> None:
         """Tests reducing dimensions 0 and 2 from 3D to 1D using SUM."""
@@ -193,7 +219,8 @@ class TestReduceDims(unittest.TestCase):
         expected_weights = np.array([[1, 1, 0, 0, 1, 1, 0, 0],
                                      [0, 0, 1, 1, 0, 0, 1, 1]])
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
 
     def test_compute_weights_3d_to_1d_axis_keep_axis_2_sum(self) -> None:
         """Tests reducing dimensions 0 and 1 from 3D to 1D using SUM."""
@@ -204,7 +231,8 @@ class TestReduceDims(unittest.TestCase):
         expected_weights = np.array([[1, 0, 1, 0, 1, 0, 1, 0],
                                      [0, 1, 0, 1, 0, 1, 0, 1]])
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
 
     def test_compute_weights_3d_to_2d_axis_reduce_axis_0_sum(self) -> None:
         """Tests reducing dimension 0 from 3D to 2D using SUM."""
@@ -217,7 +245,8 @@ class TestReduceDims(unittest.TestCase):
                                      [0, 0, 1, 0, 0, 0, 1, 0],
                                      [0, 0, 0, 1, 0, 0, 0, 1]])
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
 
     def test_compute_weights_3d_to_2d_axis_reduce_axis_1_sum(self) -> None:
         """Tests reducing dimension 1 from 3D to 2D using SUM."""
@@ -230,7 +259,8 @@ class TestReduceDims(unittest.TestCase):
                                      [0, 0, 0, 0, 1, 0, 1, 0],
                                      [0, 0, 0, 0, 0, 1, 0, 1]])
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
 
     def test_compute_weights_3d_to_2d_axis_reduce_axis_2_sum(self) -> None:
         """Tests reducing dimension 2 from 3D to 2D using SUM."""
@@ -243,7 +273,8 @@ class TestReduceDims(unittest.TestCase):
                                      [0, 0, 0, 0, 1, 1, 0, 0],
                                      [0, 0, 0, 0, 0, 0, 1, 1]])
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
 
 
 class TestExpandDims(unittest.TestCase):
@@ -252,6 +283,22 @@ class TestExpandDims(unittest.TestCase):
         op = ExpandDims(new_dims_shape=(5,))
         self.assertIsInstance(op, ExpandDims)
 
+    def test_multiplying_with_reduce_dims_does_not_overflow(self) -> None:
+        """Tests whether multiplying the weights of ExpandDims and ReduceDims
+        counts all paths through the expanded dimension, even if there are
+        more of them than a small integer type could hold."""
+        expand_op = ExpandDims(new_dims_shape=(300,))
+        expand_op.configure(input_shape=(2,))
+        reduce_op = ReduceDims(reduce_dims=(1,))
+        reduce_op.configure(input_shape=(2, 300))
+
+        computed_weights = reduce_op.compute_weights() \
+            @ expand_op.compute_weights()
+        expected_weights = np.eye(2) * 300
+
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
+
     def test_compute_weights_0d_to_1d(self) -> None:
         """Tests expanding dimensionality from 0D to 1D."""
         op = ExpandDims(new_dims_shape=(3,))
@@ -259,7 +306,8 @@ class TestExpandDims(unittest.TestCase):
         computed_weights = op.compute_weights()
         expected_weights = np.ones((3, 1))
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
 
     def test_compute_weights_0d_to_2d(self) -> None:
         """Tests expanding dimensionality from 0D to 2D."""
@@ -268,7 +316,8 @@ class TestExpandDims(unittest.TestCase):
         computed_weights = op.compute_weights()
         expected_weights = np.ones((9, 1))
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
 
     def test_compute_weights_0d_to_3d(self) -> None:
         """Tests expanding dimensionality from 0D to 3D."""
@@ -277,7 +326,8 @@ class TestExpandDims(unittest.TestCase):
         computed_weights = op.compute_weights()
         expected_weights = np.ones((27, 1))
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
 
     def test_compute_weights_1d_to_2d(self) -> None:
         """Tests expanding dimensionality from 1D to 2D."""
@@ -296,7 +346,8 @@ class TestExpandDims(unittest.TestCase):
                                      [0, 0, 1],
                                      [0, 0, 1]])
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
 
     def test_compute_weights_1d_to_3d(self) -> None:
         """Tests expanding dimensionality from 1D to 3D."""
@@ -312,7 +363,8 @@ class TestExpandDims(unittest.TestCase):
                                      [0, 1],
                                      [0, 1]])
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
 
     def test_compute_weights_2d_to_3d(self) -> None:
         """Tests expanding dimensionality from 2D to 3D."""
@@ -328,7 +380,8 @@ class TestExpandDims(unittest.TestCase):
                                      [0, 0, 0, 1],
                                      [0, 0, 0, 1]])
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
 
 
 class TestReorder(unittest.TestCase):
@@ -344,7 +397,8 @@ class TestReorder(unittest.TestCase):
         computed_weights = op.compute_weights()
         expected_weights = np.eye(9)
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
 
     def test_compute_weights_reordered_2d(self) -> None:
         """Tests reordering a 2D input by switching the dimensions."""
@@ -361,7 +415,20 @@ class TestReorder(unittest.TestCase):
                                      [0, 0, 0, 0, 0, 1, 0, 0, 0],
                                      [0, 0, 0, 0, 0, 0, 0, 0, 1]])
 
-        self.assertTrue(np.array_equal(computed_weights, expected_weights))
+        self.assertTrue(np.array_equal(computed_weights.toarray(),
+                                       expected_weights))
+
+    def test_compute_weights_reordered_2d_negative_index(self) -> None:
+        """Tests whether reordering with negative indices in <order>
+        produces the same weights as with the equivalent positive indices."""
+        op_negative = Reorder(order=(-1, 0))
+        op_negative.configure(input_shape=(3, 3))
+        op_positive = Reorder(order=(1, 0))
+        op_positive.configure(input_shape=(3, 3))
+
+        self.assertTrue(np.array_equal(
+            op_negative.compute_weights().toarray(),
+            op_positive.compute_weights().toarray()))
 
     def test_compute_weights_reordered_3d(self) -> None:
         """Tests reordering a 3D input by switching the dimensions in all
@@ -399,20 +466,20 @@ class TestReorder(unittest.TestCase):
                       [0, 0, 0, 0, 0, 0, 1, 0],
                       [0, 0, 0, 0, 0, 0, 0, 1]]),
             np.array([[1, 0, 0, 0, 0, 0, 0, 0],
-                      [0, 0, 1, 0, 0, 0, 0, 0],
                       [0, 0, 0, 0, 1, 0, 0, 0],
-                      [0, 0, 0, 0, 0, 0, 1, 0],
                       [0, 1, 0, 0, 0, 0, 0, 0],
-                      [0, 0, 0, 1, 0, 0, 0, 0],
                       [0, 0, 0, 0, 0, 1, 0, 0],
+                      [0, 0, 1, 0, 0, 0, 0, 0],
+                      [0, 0, 0, 0, 0, 0, 1, 0],
+                      [0, 0, 0, 1, 0, 0, 0, 0],
                       [0, 0, 0, 0, 0, 0, 0, 1]]),
             np.array([[1, 0, 0, 0, 0, 0, 0, 0],
-                      [0, 0, 0, 0, 1, 0, 0, 0],
-                      [0, 1, 0, 0, 0, 0, 0, 0],
-                      [0, 0, 0, 0, 0, 1, 0, 0],
                       [0, 0, 1, 0, 0, 0, 0, 0],
+                      [0, 0, 0, 0, 1, 0, 0, 0],
                       [0, 0, 0, 0, 0, 0, 1, 0],
+                      [0, 1, 0, 0, 0, 0, 0, 0],
                       [0, 0, 0, 1, 0, 0, 0, 0],
+                      [0, 0, 0, 0, 0, 1, 0, 0],
                       [0, 0, 0, 0, 0, 0, 0, 1]]),
             np.array([[1, 0, 0, 0, 0, 0, 0, 0],
                       [0, 0, 0, 0, 1, 0, 0, 0],
@@ -428,7 +495,36 @@ class TestReorder(unittest.TestCase):
             op.configure(input_shape=(2, 2, 2))
             computed = op.compute_weights()
 
-            self.assertTrue(np.array_equal(computed, expected))
+            self.assertTrue(np.array_equal(computed.toarray(), expected))
+
+    def test_compute_weights_with_list_order(self) -> None:
+        """Tests whether <order> may be given as a list."""
+        op_list = Reorder(order=[1, 0])
+        op_list.configure(input_shape=(2, 3))
+        op_tuple = Reorder(order=(1, 0))
+        op_tuple.configure(input_shape=(2, 3))
+
+        self.assertTrue(np.array_equal(op_list.compute_weights().toarray(),
+                                       op_tuple.compute_weights().toarray()))
+
+    def test_compute_weights_reordered_3d_non_cubic(self) -> None:
+        """Tests whether reordering a 3D input with dimensions of different
+        sizes computes the same result as numpy.transpose, in particular
+        for cyclic permutations of the dimensions."""
+        input_shape = (2, 3, 4)
+        x = np.arange(np.prod(input_shape)).reshape(input_shape)
+
+        for order in [(1, 2, 0), (2, 0, 1)]:
+            with self.subTest(order=order):
+                op = Reorder(order=order)
+                op.configure(input_shape=input_shape)
+                computed = op.compute_weights()
+
+                self.assertEqual(op.output_shape,
+                                 np.transpose(x, order).shape)
+                self.assertTrue(np.array_equal(
+                    computed @ x.ravel(),
+                    np.transpose(x, order).ravel()))
 
 
 class TestConvolution(unittest.TestCase):
@@ -176,6 +176,13 @@ class TestReduceDimsHandler(unittest.TestCase):
         sh.configure(input_shape=(2, 3, 4))
         self.assertEqual(sh.output_shape, (1,))
 
+    def test_kept_dims(self) -> None:
+        """Tests whether the indices of the kept input dimensions are
+        positive and exclude the reduced dimensions."""
+        sh = ReduceDimsHandler(reduce_dims=(0, -1))
+        sh.configure(input_shape=(2, 3, 4, 5))
+        self.assertEqual(sh.kept_dims, (1, 2))
+
     def test_order_of_reduce_dims_does_not_impact_result(self) -> None:
         """Tests whether the order of <reduce_dims> does not matter."""
         input_shape = (3, 4, 5)
@@ -195,6 +202,26 @@ class TestReduceDimsHandler(unittest.TestCase):
             sh = ReduceDimsHandler(reduce_dims=2)
             sh.configure(input_shape=(2, 4))
 
+    def test_configuring_subclass_with_different_constructor(self) -> None:
+        """Tests whether a subclass with a constructor that does not take
+        the arguments of ReduceDimsHandler can be configured repeatedly."""
+        class ReduceFirstDimHandler(ReduceDimsHandler):
+            def __init__(self) -> None:
+                super().__init__(reduce_dims=0)
+
+        for _ in range(2):
+            sh = ReduceFirstDimHandler()
+            sh.configure(input_shape=(2, 4))
+            self.assertEqual(sh.output_shape, (4,))
+
+    def test_repeated_configuration_raises_error(self) -> None:
+        """Tests whether an invalid configuration raises an error every time,
+        not only the first time it is encountered."""
+        for _ in range(2):
+            with self.assertRaises(IndexError):
+                sh = ReduceDimsHandler(reduce_dims=2)
+                sh.configure(input_shape=(2, 4))
+
     def test_reduce_dims_with_negative_out_of_bounds_index_raises_error(self)\
             -> None:
         """Tests whether an error is raised when <reduce_dims> contains a
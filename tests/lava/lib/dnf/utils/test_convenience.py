@@ -5,7 +5,10 @@
 import unittest
 import numpy as np
 
-from lava.lib.dnf.utils.convenience import num_neurons, num_dims, to_ndarray
+from lava.lib.dnf.utils.convenience import (num_neurons,
+                                            num_dims,
+                                            shapes_equal,
+                                            to_ndarray)
 
 
 class TestNumNeurons(unittest.TestCase):
@@ -42,6 +45,22 @@ class TestNumDims(unittest.TestCase):
         self.assertEqual(dims, 2)
 
 
+class TestShapesEqual(unittest.TestCase):
+    def test_identical_shapes_are_equal(self) -> None:
+        """Tests whether a shape is equal to itself."""
+        shape = (5, 3)
+        self.assertTrue(shapes_equal(shape, shape))
+
+    def test_equal_shapes_are_equal(self) -> None:
+        """Tests whether distinct shape objects with the same entries are
+        equal."""
+        self.assertTrue(shapes_equal((5, 3), tuple([5, 3])))
+
+    def test_different_shapes_are_not_equal(self) -> None:
+        """Tests whether shapes with different entries are not equal."""
+        self.assertFalse(shapes_equal((5, 3), (3, 5)))
+
+
 class TestToNdarray(unittest.TestCase):
     def test_converting_float(self) -> None:
         """Tests whether floats can be converted to an ndarray."""
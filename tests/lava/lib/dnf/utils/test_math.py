@@ -4,8 +4,31 @@
 
 import unittest
 import numpy as np
-
-from lava.lib.dnf.utils.math import is_odd, gauss
+import scipy.stats
+
+from lava.lib.dnf.utils.math import (
+    is_odd,
+    gauss,
+    gauss_grid,
+    evaluate_gauss)
+
+
+def reference_gauss(shape, amplitude, mean, stddev, domain=None):
+    """Computes a Gaussian as the normalized probability density function of
+    scipy's multivariate normal distribution, with <stddev> used as the
+    diagonal of the covariance matrix."""
+    if domain is None:
+        domain = np.zeros((len(shape), 2))
+        domain[:, 1] = np.array(shape) - 1
+    linspaces = [np.linspace(domain[i, 0], domain[i, 1], shape[i])
+                 for i in range(len(shape))]
+    mean = np.broadcast_to(mean, (len(shape),))
+    stddev = np.broadcast_to(stddev, (len(shape),))
+    points = np.stack(np.meshgrid(*linspaces, indexing="ij"), axis=-1)
+    pdf = scipy.stats.multivariate_normal.pdf(points,
+                                              mean=mean,
+                                              cov=stddev)
+    return amplitude * pdf / np.max(pdf)
 
 
 class TestGauss(unittest.TestCase):
@@ -60,6 +83,35 @@ class TestGauss(unittest.TestCase):
         gaussian_broad = gauss(shape, stddev=2)
         self.assertTrue(gaussian_narrow[1] < gaussian_broad[1])
 
+    def test_non_positive_stddev_raises_error(self) -> None:
+        """Tests whether an error is raised when the <stddev> argument is
+        not positive."""
+        for stddev in [0, np.array([1.0, 0.0]), np.array([1.0, -1.0])]:
+            with self.subTest(stddev=stddev):
+                with self.assertRaises(ValueError):
+                    gauss((5, 3), stddev=stddev)
+
+    def test_values_match_reference(self) -> None:
+        """Tests whether the values of the Gaussian match the normalized
+        probability density function of a multivariate normal
+        distribution."""
+        shape = (6, 4, 3)
+        amplitude = 3.0
+        mean = np.array([2.0, 1.0, 0.5])
+        stddev = np.array([2.0, 0.5, 1.5])
+        domain = np.array([[-1.0, 4.0], [0.0, 3.0], [-2.0, 2.0]])
+        gaussian = gauss(shape,
+                         domain=domain,
+                         amplitude=amplitude,
+                         mean=mean,
+                         stddev=stddev)
+        expected = reference_gauss(shape,
+                                   amplitude=amplitude,
+                                   mean=mean,
+                                   stddev=stddev,
+                                   domain=domain)
+        self.assertTrue(np.allclose(gaussian, expected))
+
     def test_domain_shape_mismatch_raises_error(self) -> None:
         """Tests whether an error is raised when the shape of the <domain>
         argument is different from <shape>."""
@@ -85,6 +137,64 @@ class TestGauss(unittest.TestCase):
             gauss(shape, stddev=stddev)
 
 
+class TestGaussGrid(unittest.TestCase):
+    def test_shape(self) -> None:
+        """Tests whether the grid holds one array of coordinates per
+        dimension and whether these broadcast to the specified shape."""
+        shape = (5, 3)
+        grid = gauss_grid(shape)
+        self.assertEqual(len(grid), len(shape))
+        self.assertEqual(np.broadcast_shapes(*[g.shape for g in grid]),
+                         shape)
+
+    def test_default_domain(self) -> None:
+        """Tests whether the coordinates default to the indices of the
+        sampling points."""
+        grid = gauss_grid((5, 3))
+        self.assertTrue(np.array_equal(grid[0].ravel(), np.arange(5)))
+        self.assertTrue(np.array_equal(grid[1].ravel(), np.arange(3)))
+
+    def test_setting_domain(self) -> None:
+        """Tests whether the coordinates span the specified domain."""
+        grid = gauss_grid((5,), domain=np.array([[-2.5, 2.5]]))
+        self.assertTrue(np.array_equal(grid[0], np.linspace(-2.5, 2.5, 5)))
+
+
+class TestEvaluateGauss(unittest.TestCase):
+    def test_values_match_reference(self) -> None:
+        """Tests whether evaluating on a precomputed grid yields the
+        normalized probability density function of a multivariate normal
+        distribution."""
+        shape = (6, 4)
+        amplitude = 3.0
+        mean = np.array([2.0, 1.0])
+        stddev = np.array([2.0, 0.5])
+        gaussian = evaluate_gauss(gauss_grid(shape),
+                                  amplitude=amplitude,
+                                  mean=mean,
+                                  stddev=stddev)
+        expected = reference_gauss(shape,
+                                   amplitude=amplitude,
+                                   mean=mean,
+                                   stddev=stddev)
+        self.assertTrue(np.allclose(gaussian, expected))
+
+    def test_writing_into_out(self) -> None:
+        """Tests whether the result is written into a given array."""
+        shape = (6, 4, 3)
+        out = np.zeros(shape)
+        gaussian = evaluate_gauss(gauss_grid(shape),
+                                  amplitude=2.0,
+                                  mean=1.0,
+                                  stddev=2.0,
+                                  out=out)
+        self.assertIs(gaussian, out)
+        self.assertTrue(np.allclose(out, reference_gauss(shape,
+                                                         amplitude=2.0,
+                                                         mean=1.0,
+                                                         stddev=2.0)))
+
+
 class TestIsOdd(unittest.TestCase):
     def test_is_odd(self) -> None:
         """Tests the is_odd() helper function."""